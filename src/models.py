@@ -1,84 +1,187 @@
+import array
 import logging
-from typing import List, Optional, Union
+import sys
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, defaultdict
+from typing import Iterable, List, Optional, Union
 from src.constants import GENRES, AUTHORS, BOOK_TITLES, MIN_YEAR, MAX_YEAR
 
 logger = logging.getLogger(__name__)
 
 
 class Book:
-    
+
+    __slots__ = ('title', 'author', 'year', 'genre', 'isbn',
+                 '_title_lower', '_author_lower',
+                 '_repr_cache', '_str_cache')
+
+    # Пул освобождённых экземпляров для сценариев с интенсивным
+    # добавлением/удалением: acquire переиспользует объект вместо аллокации
+    _pool: List['Book'] = []
+    _POOL_MAX = 1024
+
+    @classmethod
+    def acquire(cls, title: str, author: str, year: int, genre: str, isbn: str) -> 'Book':
+        if cls._pool:
+            book = cls._pool.pop()
+            book.__init__(title, author, year, genre, isbn)
+            return book
+        return cls(title, author, year, genre, isbn)
+
+    def release(self) -> None:
+        # Вызывать только когда на книгу больше нет внешних ссылок:
+        # объект может быть переинициализирован следующим acquire
+        if len(Book._pool) < Book._POOL_MAX:
+            Book._pool.append(self)
+
     def __init__(self, title: str, author: str, year: int, genre: str, isbn: str):
         self.title = title
-        self.author = author
+        # Авторы и жанры берутся из небольшого словаря значений:
+        # интернирование даёт один общий str-объект на значение,
+        # а сравнение/хэширование — по указателю
+        self.author = sys.intern(author)
         self.year = year
-        self.genre = genre
-        self.isbn = isbn
-    
+        self.genre = sys.intern(genre)
+        # ISBN — канонический идентификатор: интернированные строки дают
+        # сравнение по указателю в __eq__ и кэшированный хэш в индексах
+        self.isbn = sys.intern(isbn)
+        # Кэш для поиска по ключевому слову: .lower() вызывается один раз,
+        # а не при каждой проверке __contains__
+        self._title_lower = title.lower()
+        self._author_lower = author.lower()
+        # Строковые представления считаются лениво и кэшируются:
+        # атрибуты книги после __init__ не меняются
+        self._repr_cache: Optional[str] = None
+        self._str_cache: Optional[str] = None
+
     def __repr__(self) -> str:
-        return f"Book(title='{self.title}', author='{self.author}', isbn='{self.isbn}')"
-    
+        if self._repr_cache is None:
+            self._repr_cache = (f"Book(title='{self.title}', "
+                                f"author='{self.author}', isbn='{self.isbn}')")
+        return self._repr_cache
+
     def __str__(self) -> str:
-        return f"{self.title} by {self.author} ({self.year}) - {self.genre} [ISBN: {self.isbn}]"
+        if self._str_cache is None:
+            self._str_cache = (f"{self.title} by {self.author} ({self.year})"
+                               f" - {self.genre} [ISBN: {self.isbn}]")
+        return self._str_cache
     
     def __eq__(self, other) -> bool:
         if not isinstance(other, Book):
             return False
         return self.isbn == other.isbn
-    
+
+    def __hash__(self) -> int:
+        # ISBN — канонический идентификатор книги (см. __eq__),
+        # поэтому книги можно класть в set/dict
+        return hash(self.isbn)
+
     def __contains__(self, keyword: str) -> bool:
         keyword_lower = keyword.lower()
-        return (keyword_lower in self.title.lower() or 
-                keyword_lower in self.author.lower())
+        return (keyword_lower in self._title_lower or
+                keyword_lower in self._author_lower)
 
 
 class BookCollection:
 
     def __init__(self):
-        self._books: List[Book] = []
-    
+        # Книги хранятся в dict по ISBN (сохраняет порядок вставки),
+        # что даёт O(1) удаление вместо линейного поиска по списку
+        self._books: dict = {}        # ISBN -> Book
+        self._list_cache: Optional[List[Book]] = None
+        self._years_cache: Optional[array.array] = None
+
+    def _invalidate_caches(self) -> None:
+        self._list_cache = None
+        self._years_cache = None
+
+    def _as_list(self) -> List[Book]:
+        # Ленивый материализованный список для доступа по индексу/срезу;
+        # сбрасывается при любой мутации
+        if self._list_cache is None:
+            self._list_cache = list(self._books.values())
+        return self._list_cache
+
     def add(self, book: Book) -> None:
-        if not isinstance(book, Book):
+        # Проверка типа только в debug-режиме: python -O убирает её
+        # из горячего пути вставки
+        if __debug__ and not isinstance(book, Book):
             raise TypeError("Можно добавлять только объекты Book")
-        self._books.append(book)
-        logger.debug(f"Added book: {book}")
-    
+        self._books[book.isbn] = book
+        self._invalidate_caches()
+        logger.debug("Added book: %s", book)
+
+    def extend(self, books: Iterable[Book]) -> None:
+        # Массовая вставка одним вызовом dict.update — цикл уходит на C-уровень
+        self._books.update((book.isbn, book) for book in books)
+        self._invalidate_caches()
+        logger.debug("Collection extended")
+
     def remove(self, isbn: str) -> bool:
-        for i, book in enumerate(self._books):
-            if book.isbn == isbn:
-                removed_book = self._books.pop(i)
-                logger.debug(f"Removed book: {removed_book}")
-                return True
-        logger.warning(f"Book with ISBN {isbn} not found")
+        removed_book = self._books.pop(isbn, None)
+        if removed_book is not None:
+            self._invalidate_caches()
+            logger.debug("Removed book: %s", removed_book)
+            return True
+        logger.warning("Book with ISBN %s not found", isbn)
         return False
-    
+
     def remove_at_index(self, index: int) -> Optional[Book]:
-        if 0 <= index < len(self._books):
-            removed_book = self._books.pop(index)
-            logger.debug(f"Removed book at index {index}: {removed_book}")
+        books = self._as_list()
+        if 0 <= index < len(books):
+            removed_book = books[index]
+            del self._books[removed_book.isbn]
+            self._invalidate_caches()
+            logger.debug("Removed book at index %d: %s", index, removed_book)
             return removed_book
         return None
-    
+
+    def pop_oldest(self) -> Optional[Book]:
+        # FIFO-вариант удаления: dict хранит порядок вставки, поэтому
+        # первая книга достаётся за O(1) без сдвига остальных
+        if not self._books:
+            return None
+        oldest_isbn = next(iter(self._books))
+        removed_book = self._books.pop(oldest_isbn)
+        self._invalidate_caches()
+        logger.debug("Removed oldest book: %s", removed_book)
+        return removed_book
+
     def clear(self) -> None:
         self._books.clear()
+        self._invalidate_caches()
         logger.debug("Collection cleared")
-    
+
+    def years(self) -> array.array:
+        # Упакованная int16-колонка годов: массовый просмотр годов читает
+        # ~2 байта на книгу вместо обхода boxed-целых по ссылкам
+        if self._years_cache is None:
+            self._years_cache = array.array(
+                'h', (book.year for book in self._books.values()))
+        return self._years_cache
+
+    def get_at(self, index: int) -> Book:
+        # Специализированный доступ по целому индексу для горячих циклов:
+        # без диспетчеризации int/slice внутри __getitem__
+        return self._as_list()[index]
+
     def __getitem__(self, key: Union[int, slice]) -> Union[Book, List[Book]]:
-        return self._books[key]
-    
+        return self._as_list()[key]
+
     def __iter__(self):
-        return iter(self._books)
-    
+        return iter(self._books.values())
+
     def __len__(self) -> int:
         return len(self._books)
-    
+
     def __contains__(self, item: Union[Book, str]) -> bool:
         if isinstance(item, Book):
-            return item in self._books
+            return item.isbn in self._books
         elif isinstance(item, str):
             # Поиск по ISBN
-            return any(book.isbn == item for book in self._books)
+            return item in self._books
         return False
-    
+
     def __repr__(self) -> str:
         return f"BookCollection(size={len(self._books)})"
 
@@ -87,57 +190,98 @@ class IndexDict:
 
     def __init__(self):
         self._by_isbn: dict = {}      # ISBN -> Book
-        self._by_author: dict = {}    # Author -> [Books]
-        self._by_year: dict = {}      # Year -> [Books]
-    
+        # Корзины хранятся как {ISBN -> Book}, а не списки:
+        # удаление по хэшу вместо линейного поиска; defaultdict убирает
+        # лишнюю проверку наличия ключа при каждой вставке
+        self._by_author: dict = defaultdict(dict)   # Author -> {ISBN -> Book}
+        self._by_year: dict = defaultdict(dict)     # Year -> {ISBN -> Book}
+        self._by_genre: dict = defaultdict(dict)    # Genre -> {ISBN -> Book}
+        # Отсортированный список годов, присутствующих в _by_year:
+        # даёт диапазонные запросы через bisect за O(log D + k)
+        self._year_keys: List[int] = []
+        # Буфер отложенных операций: корзины обновляются пачкой
+        # при первом запросе, а не на каждой мутации
+        self._pending: List[tuple] = []
+
     def add_book(self, book: Book) -> None:
-        # Индекс по ISBN
+        # Индекс по ISBN поддерживается всегда — он нужен пути удаления.
+        # Ключи снимаются в момент мутации: к моменту применения буфера
+        # объект может быть переинициализирован через пул (Book.acquire)
         self._by_isbn[book.isbn] = book
-        
-        # Индекс по автору
-        if book.author not in self._by_author:
-            self._by_author[book.author] = []
-        self._by_author[book.author].append(book)
-        
-        # Индекс по году
-        if book.year not in self._by_year:
-            self._by_year[book.year] = []
-        self._by_year[book.year].append(book)
-        
-        logger.debug(f"Indexed book: {book}")
-    
+        self._pending.append(
+            (True, book, book.author, book.year, book.genre, book.isbn))
+        logger.debug("Indexed book: %s", book)
+
     def remove_book(self, book: Book) -> bool:
-        removed = False
-        
-        # Удалить из ISBN индекса
-        if book.isbn in self._by_isbn:
-            del self._by_isbn[book.isbn]
-            removed = True
-        
-        # Удалить из автора индекса
-        if book.author in self._by_author:
-            if book in self._by_author[book.author]:
-                self._by_author[book.author].remove(book)
-                if not self._by_author[book.author]:
-                    del self._by_author[book.author]
-        
-        # Удалить из года индекса
-        if book.year in self._by_year:
-            if book in self._by_year[book.year]:
-                self._by_year[book.year].remove(book)
-                if not self._by_year[book.year]:
-                    del self._by_year[book.year]
-        
-        return removed
-    
+        if book.isbn not in self._by_isbn:
+            return False
+        del self._by_isbn[book.isbn]
+        # Сам объект в буфер не кладётся: после возврата индексу книга
+        # больше не нужна, и владелец может сразу вернуть её в пул
+        self._pending.append(
+            (False, None, book.author, book.year, book.genre, book.isbn))
+        return True
+
+    def _apply_pending(self) -> None:
+        # Применить накопленные мутации к корзинам одним проходом;
+        # используются ключи, снятые при постановке в буфер, а не
+        # текущие атрибуты объекта
+        if not self._pending:
+            return
+        for is_add, book, author, year, genre, isbn in self._pending:
+            if is_add:
+                self._by_author[author][isbn] = book
+                year_bucket = self._by_year[year]
+                if not year_bucket:
+                    insort(self._year_keys, year)
+                year_bucket[isbn] = book
+                self._by_genre[genre][isbn] = book
+            else:
+                self._remove_from_bucket(self._by_author, author, isbn)
+                if self._remove_from_bucket(self._by_year, year, isbn):
+                    self._year_keys.pop(bisect_left(self._year_keys, year))
+                self._remove_from_bucket(self._by_genre, genre, isbn)
+        self._pending.clear()
+
+    @staticmethod
+    def _remove_from_bucket(index: dict, key, isbn: str) -> bool:
+        # Возвращает True, если корзина опустела и была удалена
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(isbn, None)
+            if not bucket:
+                del index[key]
+                return True
+        return False
+
     def get_by_isbn(self, isbn: str) -> Optional[Book]:
         return self._by_isbn.get(isbn)
-    
+
     def get_by_author(self, author: str) -> List[Book]:
-        return self._by_author.get(author, [])
-    
+        self._apply_pending()
+        bucket = self._by_author.get(author)
+        return list(bucket.values()) if bucket else []
+
     def get_by_year(self, year: int) -> List[Book]:
-        return self._by_year.get(year, [])
+        self._apply_pending()
+        bucket = self._by_year.get(year)
+        return list(bucket.values()) if bucket else []
+
+    def get_by_year_range(self, start: int, end: int) -> List[Book]:
+        # Срез отсортированных годов через bisect вместо цикла по каждому
+        # году диапазона: O(log D + k), где D — число различных годов
+        self._apply_pending()
+        lo = bisect_left(self._year_keys, start)
+        hi = bisect_right(self._year_keys, end)
+        results: List[Book] = []
+        for year in self._year_keys[lo:hi]:
+            results.extend(self._by_year[year].values())
+        return results
+
+    def get_by_genre(self, genre: str) -> List[Book]:
+        self._apply_pending()
+        bucket = self._by_genre.get(genre)
+        return list(bucket.values()) if bucket else []
     
     def __getitem__(self, key: str):
         return self._by_isbn.get(key)
@@ -149,9 +293,11 @@ class IndexDict:
         return len(self._by_isbn)
     
     def __repr__(self) -> str:
+        self._apply_pending()
         return (f"IndexDict(by_isbn={len(self._by_isbn)}, "
                 f"by_author={len(self._by_author)}, "
-                f"by_year={len(self._by_year)})")
+                f"by_year={len(self._by_year)}, "
+                f"by_genre={len(self._by_genre)})")
 
 
 class Library:
@@ -160,23 +306,78 @@ class Library:
         self.name = name
         self.books = BookCollection()
         self.indexes = IndexDict()
-        logger.info(f"Library '{name}' initialized")
-    
+        # Инкрементальная статистика: обновляется при добавлении/удалении
+        self._author_counts: Counter = Counter()
+        self._year_counts: Counter = Counter()
+        self._genre_counts: Counter = Counter()
+        # Кэш (min_year, max_year); сбрасывается, когда удаляется
+        # последняя книга граничного года
+        self._year_range: Optional[tuple] = None
+        # Поисковый корпус строится лениво при первом search_by_keyword
+        # и сбрасывается при мутации
+        self._keyword_corpus: Optional[List[tuple]] = None
+        logger.info("Library '%s' initialized", name)
+
     def add_book(self, book: Book) -> None:
         self.books.add(book)
         self.indexes.add_book(book)
-        logger.info(f"Book added to library: {book}")
-    
+        self._author_counts[book.author] += 1
+        self._year_counts[book.year] += 1
+        self._genre_counts[book.genre] += 1
+        if self._year_range is not None:
+            lo, hi = self._year_range
+            self._year_range = (min(lo, book.year), max(hi, book.year))
+        self._keyword_corpus = None
+        logger.info("Book added to library: %s", book)
+
     def remove_book(self, isbn: str) -> bool:
         # Найти книгу
         book = self.indexes.get_by_isbn(isbn)
         if book:
             self.books.remove(isbn)
             self.indexes.remove_book(book)
-            logger.info(f"Book removed from library: {book}")
+            self._discount(self._author_counts, book.author)
+            self._discount(self._year_counts, book.year)
+            self._discount(self._genre_counts, book.genre)
+            if (self._year_range is not None
+                    and book.year not in self._year_counts
+                    and book.year in self._year_range):
+                self._year_range = None
+            self._keyword_corpus = None
+            logger.info("Book removed from library: %s", book)
+            # Библиотека была владельцем книги — вернуть объект в пул;
+            # к этому моменту ни коллекция, ни индексы (включая буфер
+            # отложенных операций) ссылок на него не держат
+            book.release()
             return True
-        logger.warning(f"Book with ISBN {isbn} not found in library")
+        logger.warning("Book with ISBN %s not found in library", isbn)
         return False
+
+    def bulk_load(self, titles: Iterable[str], authors: Iterable[str],
+                  years: Iterable[int], genres: Iterable[str],
+                  isbns: Iterable[str]) -> int:
+        # Массовая загрузка из колонок (как при чтении из файла):
+        # одна вставка через extend и пакетное обновление счётчиков
+        # вместо поштучных add_book
+        books = [Book(title, author, year, genre, isbn)
+                 for title, author, year, genre, isbn
+                 in zip(titles, authors, years, genres, isbns)]
+        self.books.extend(books)
+        for book in books:
+            self.indexes.add_book(book)
+        self._author_counts.update(book.author for book in books)
+        self._year_counts.update(book.year for book in books)
+        self._genre_counts.update(book.genre for book in books)
+        self._year_range = None
+        self._keyword_corpus = None
+        logger.info("Bulk loaded %d books into library", len(books))
+        return len(books)
+
+    @staticmethod
+    def _discount(counts: Counter, key) -> None:
+        counts[key] -= 1
+        if counts[key] <= 0:
+            del counts[key]
     
     def search_by_isbn(self, isbn: str) -> Optional[Book]:
         return self.indexes.get_by_isbn(isbn)
@@ -186,32 +387,42 @@ class Library:
     
     def search_by_year(self, year: int) -> List[Book]:
         return self.indexes.get_by_year(year)
+
+    def search_by_year_range(self, start: int, end: int) -> List[Book]:
+        return self.indexes.get_by_year_range(start, end)
     
     def search_by_genre(self, genre: str) -> List[Book]:
-        results = []
-        for book in self.books:
-            if book.genre == genre:
-                results.append(book)
-        return results
+        return self.indexes.get_by_genre(genre)
+
+    def _ensure_keyword_corpus(self) -> List[tuple]:
+        # Один прогон по коллекции готовит пары (текст, книга), где текст —
+        # склеенные через NUL название и автор; дальше каждый запрос делает
+        # одну проверку подстроки на книгу вместо двух
+        if self._keyword_corpus is None:
+            self._keyword_corpus = [
+                (book._title_lower + "\0" + book._author_lower, book)
+                for book in self.books
+            ]
+        return self._keyword_corpus
+
+    def search_by_keyword(self, keyword: str) -> List[Book]:
+        keyword_lower = keyword.lower()
+        return [book for text, book in self._ensure_keyword_corpus()
+                if keyword_lower in text]
     
     def get_all_books(self) -> BookCollection:
         return self.books
     
     def get_statistics(self) -> dict:
-        authors = set()
-        years = set()
-        genres = set()
-        
-        for book in self.books:
-            authors.add(book.author)
-            years.add(book.year)
-            genres.add(book.genre)
-        
+        # Счётчики поддерживаются инкрементально, поэтому обход книг не нужен;
+        # диапазон годов пересчитывается лениво и только после инвалидации
+        if self._year_range is None and self._year_counts:
+            self._year_range = (min(self._year_counts), max(self._year_counts))
         return {
             'total_books': len(self.books),
-            'unique_authors': len(authors),
-            'year_range': (min(years), max(years)) if years else None,
-            'genres': list(genres)
+            'unique_authors': len(self._author_counts),
+            'year_range': self._year_range,
+            'genres': list(self._genre_counts)
         }
     
     def __repr__(self) -> str:
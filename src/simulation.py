@@ -38,7 +38,8 @@ class LibrarySimulator:
         genre = random.choice(GENRES)
         isbn = self._generate_isbn()
         
-        book = Book(title, author, year, genre, isbn)
+        # acquire переиспользует освобождённые Library.remove_book объекты
+        book = Book.acquire(title, author, year, genre, isbn)
         self.library.add_book(book)
         
         return f"Added new book: {book}"
@@ -49,7 +50,7 @@ class LibrarySimulator:
         
         # Получить случайную книгу
         random_index = random.randint(0, len(self.library.books) - 1)
-        book_to_remove = self.library.books[random_index]
+        book_to_remove = self.library.books.get_at(random_index)
         
         self.library.remove_book(book_to_remove.isbn)
         return f"Removed book: {book_to_remove}"
@@ -21,6 +21,26 @@ class TestBook:
         assert book1 == book2  # Одинаковый ISBN
         assert book1 != book3  # Разные ISBN
     
+    def test_book_hash(self):
+        book1 = Book("Title1", "Author1", 2020, "Fiction", "ISBN-001")
+        book2 = Book("Title2", "Author2", 2021, "Science", "ISBN-001")
+        book3 = Book("Title1", "Author1", 2020, "Fiction", "ISBN-002")
+
+        # Хэш согласован с __eq__ (по ISBN) — set дедуплицирует
+        assert hash(book1) == hash(book2)
+        assert len({book1, book2, book3}) == 2
+
+    def test_book_pool(self):
+        book = Book("Test", "Author", 2020, "Fiction", "ISBN-100")
+        book.release()
+
+        # acquire переиспользует освобождённый объект и переинициализирует его
+        recycled = Book.acquire("Other", "Writer", 2021, "Science", "ISBN-200")
+        assert recycled is book
+        assert recycled.title == "Other"
+        assert recycled.isbn == "ISBN-200"
+        assert "writer" in recycled
+
     def test_book_repr(self):
         book = Book("Foundation", "Asimov", 1951, "Science", "ISBN-001")
         repr_str = repr(book)
@@ -48,6 +68,17 @@ class TestBookCollection:
         collection.add(book)
         assert len(collection) == 1
     
+    def test_extend(self):
+        collection = BookCollection()
+        books = [
+            Book(f"Book{i}", f"Author{i}", 2020 + i, "Fiction", f"ISBN-{i:03d}")
+            for i in range(3)
+        ]
+        collection.extend(books)
+
+        assert len(collection) == 3
+        assert list(collection) == books
+
     def test_getitem_single(self):
         collection = BookCollection()
         book1 = Book("Book1", "Author1", 2020, "Fiction", "ISBN-001")
@@ -58,6 +89,10 @@ class TestBookCollection:
         assert collection[0] == book1
         assert collection[1] == book2
         assert collection[-1] == book2
+
+        # Специализированный доступ по индексу эквивалентен __getitem__
+        assert collection.get_at(0) == book1
+        assert collection.get_at(-1) == book2
     
     def test_getitem_slice(self):
         collection = BookCollection()
@@ -100,6 +135,21 @@ class TestBookCollection:
         assert other_book not in collection
         assert "ISBN-999" not in collection
     
+    def test_years_column(self):
+        collection = BookCollection()
+        books = [
+            Book(f"Book{i}", f"Author{i}", 2020 + i, "Fiction", f"ISBN-{i:03d}")
+            for i in range(3)
+        ]
+        for book in books:
+            collection.add(book)
+
+        assert list(collection.years()) == [2020, 2021, 2022]
+
+        # Колонка должна сбрасываться при мутации
+        collection.remove("ISBN-001")
+        assert list(collection.years()) == [2020, 2022]
+
     def test_remove(self):
         collection = BookCollection()
         book1 = Book("Book1", "Author1", 2020, "Fiction", "ISBN-001")
@@ -117,6 +167,22 @@ class TestBookCollection:
         removed = collection.remove("ISBN-999")
         assert removed is False
     
+    def test_pop_oldest(self):
+        collection = BookCollection()
+        assert collection.pop_oldest() is None
+
+        books = [
+            Book(f"Book{i}", f"Author{i}", 2020 + i, "Fiction", f"ISBN-{i:03d}")
+            for i in range(3)
+        ]
+        for book in books:
+            collection.add(book)
+
+        # Книги извлекаются в порядке добавления (FIFO)
+        assert collection.pop_oldest() == books[0]
+        assert collection.pop_oldest() == books[1]
+        assert len(collection) == 1
+
     def test_remove_at_index(self):
         collection = BookCollection()
         books = [
@@ -189,7 +255,74 @@ class TestIndexDict:
         
         year_2021 = index.get_by_year(2021)
         assert len(year_2021) == 1
-    
+
+    def test_get_by_genre(self):
+        index = IndexDict()
+        book1 = Book("Book1", "Author1", 2020, "Fiction", "ISBN-001")
+        book2 = Book("Book2", "Author2", 2021, "Science", "ISBN-002")
+        book3 = Book("Book3", "Author3", 2022, "Fiction", "ISBN-003")
+
+        index.add_book(book1)
+        index.add_book(book2)
+        index.add_book(book3)
+
+        fiction = index.get_by_genre("Fiction")
+        assert len(fiction) == 2
+        assert book1 in fiction
+        assert book3 in fiction
+
+        empty = index.get_by_genre("Unknown")
+        assert len(empty) == 0
+
+    def test_get_by_year_range(self):
+        index = IndexDict()
+        book1 = Book("Book1", "Author1", 1950, "Fiction", "ISBN-001")
+        book2 = Book("Book2", "Author2", 1975, "Science", "ISBN-002")
+        book3 = Book("Book3", "Author3", 1980, "Fiction", "ISBN-003")
+        book4 = Book("Book4", "Author4", 2000, "History", "ISBN-004")
+
+        for book in (book1, book2, book3, book4):
+            index.add_book(book)
+
+        in_range = index.get_by_year_range(1960, 1990)
+        assert in_range == [book2, book3]
+
+        assert index.get_by_year_range(1950, 2000) == [book1, book2, book3, book4]
+        assert index.get_by_year_range(2001, 2010) == []
+
+        # Диапазон должен учитывать удаления
+        index.remove_book(book2)
+        assert index.get_by_year_range(1960, 1990) == [book3]
+
+    def test_deferred_bucket_updates(self):
+        index = IndexDict()
+        book1 = Book("Book1", "Asimov", 2020, "Fiction", "ISBN-001")
+        book2 = Book("Book2", "Asimov", 2020, "Fiction", "ISBN-002")
+
+        # Серия мутаций без запросов, затем один запрос —
+        # корзины должны отражать итоговое состояние
+        index.add_book(book1)
+        index.add_book(book2)
+        index.remove_book(book1)
+
+        assert index.get_by_author("Asimov") == [book2]
+        assert index.get_by_year(2020) == [book2]
+        assert index.get_by_genre("Fiction") == [book2]
+
+        # Переиспользование объекта через пул между remove и запросом:
+        # буфер должен чистить корзины по ключам на момент удаления,
+        # а не по атрибутам переинициализированного объекта
+        index.remove_book(book2)
+        book2.release()
+        recycled = Book.acquire("Other", "Petrov", 1999, "History", "ISBN-099")
+        assert recycled is book2
+
+        assert index.get_by_author("Asimov") == []
+        assert index.get_by_year(2020) == []
+        assert index.get_by_genre("Fiction") == []
+        assert index.get_by_year_range(2000, 2024) == []
+        assert index.get_by_author("Petrov") == []
+
     def test_remove_book(self):
         index = IndexDict()
         book = Book("Test", "Author", 2020, "Fiction", "ISBN-001")
@@ -253,7 +386,17 @@ class TestLibrary:
         # Поиск по жанру
         science_books = library.search_by_genre("Science")
         assert len(science_books) == 2
-    
+
+        # Поиск по ключевому слову (регистронезависимый)
+        keyword_books = library.search_by_keyword("asimov")
+        assert len(keyword_books) == 2
+        assert library.search_by_keyword("Foundation") == [book1]
+        assert library.search_by_keyword("nonexistent") == []
+
+        # Корпус для поиска должен сбрасываться после мутаций
+        library.remove_book("ISBN-003")
+        assert library.search_by_keyword("asimov") == [book1]
+
     def test_get_statistics(self):
         library = Library("Test")
         book1 = Book("Foundation", "Asimov", 1951, "Science", "ISBN-001")
@@ -267,6 +410,46 @@ class TestLibrary:
         assert stats['unique_authors'] == 2
         assert 'Science' in stats['genres']
 
+    def test_bulk_load(self):
+        library = Library("Test")
+        count = library.bulk_load(
+            titles=["Foundation", "Cosmos", "Robot"],
+            authors=["Asimov", "Sagan", "Asimov"],
+            years=[1951, 1980, 1950],
+            genres=["Science", "Science", "Fiction"],
+            isbns=["ISBN-001", "ISBN-002", "ISBN-003"],
+        )
+
+        assert count == 3
+        assert len(library.books) == 3
+        assert library.search_by_isbn("ISBN-002").title == "Cosmos"
+        assert len(library.search_by_author("Asimov")) == 2
+
+        stats = library.get_statistics()
+        assert stats['total_books'] == 3
+        assert stats['unique_authors'] == 2
+        assert stats['year_range'] == (1950, 1980)
+
+    def test_get_statistics_after_removal(self):
+        library = Library("Test")
+        book1 = Book("Foundation", "Asimov", 1951, "Science", "ISBN-001")
+        book2 = Book("Cosmos", "Sagan", 1980, "Fiction", "ISBN-002")
+
+        library.add_book(book1)
+        library.add_book(book2)
+        library.remove_book("ISBN-002")
+
+        stats = library.get_statistics()
+        assert stats['total_books'] == 1
+        assert stats['unique_authors'] == 1
+        assert stats['year_range'] == (1951, 1951)
+        assert stats['genres'] == ['Science']
+
+        library.remove_book("ISBN-001")
+        stats = library.get_statistics()
+        assert stats['total_books'] == 0
+        assert stats['year_range'] is None
+
 
 class TestLibrarySimulator:
     